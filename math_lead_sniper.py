@@ -9,19 +9,48 @@ Author: Money Printing Machine
 """
 
 import os
+import re
 import sys
 import time
+import signal
+import asyncio
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Set, Dict, Optional
+from typing import List, Dict, Optional
 import hashlib
 
-import praw
+import asyncpraw
 import feedparser
-import requests
+import aiohttp
 import google.generativeai as genai
+from aiolimiter import AsyncLimiter
 from dotenv import load_dotenv
 
+try:
+    import ahocorasick
+except ImportError:
+    # Optional accelerator; keyword matching falls back to substring scans
+    ahocorasick = None
+
+try:
+    from blake3 import blake3
+except ImportError:
+    # Optional accelerator; hashing falls back to SHA-256
+    blake3 = None
+
+try:
+    import re2
+except ImportError:
+    # Optional DFA regex engine; falls back to stdlib re
+    re2 = None
+
+try:
+    import orjson
+except ImportError:
+    # Optional accelerator; payload serialization falls back to stdlib json
+    orjson = None
+
 
 # Configure logging
 logging.basicConfig(
@@ -55,19 +84,50 @@ class MathLeadSniper:
         'asap', 'deadline', 'final', 'midterm'
     ]
 
+    # Lowercased once at class load; the match path compares against these
+    _LOWERED_TRIGGERS = tuple(keyword.lower() for keyword in TRIGGER_KEYWORDS)
+
     # Gemini system instruction for lead qualification
     SYSTEM_INSTRUCTION = (
-        "You are a lead qualifier for a math tutor. Analyze the following text. "
+        "You are a lead qualifier for a math tutor. Analyze each numbered item below. "
         "Does the user explicitly express a desperate need for help, tutoring, "
         "or is struggling with an upcoming exam? If it is a spam bot, a promotional ad, "
-        "a general discussion about math, or a rant with no intent to learn, return NO. "
-        "If it is a student explicitly asking for help, return YES. "
-        "Respond with ONLY 'YES' or 'NO'."
+        "a general discussion about math, or a rant with no intent to learn, answer N. "
+        "If it is a student explicitly asking for help, answer Y. "
+        "Respond with exactly one line per item in the form 'i: Y' or 'i: N', "
+        "where i is the item number. Output nothing else."
     )
 
     # Cooldown period (in seconds) to prevent duplicate notifications
     COOLDOWN_PERIOD = 3600  # 1 hour
 
+    # Gemini batching: collect up to MAX_BATCH candidates (or wait BATCH_WINDOW
+    # seconds) and classify them in a single API call
+    MAX_BATCH = 16
+    BATCH_WINDOW = 3.0  # seconds
+
+    # Cap on remembered RSS entry IDs so a long-running daemon doesn't leak
+    MAX_SEEN_RSS_ENTRIES = 10_000
+
+    # Gemini free-tier quotas: requests and tokens per minute
+    GEMINI_RPM_LIMIT = 60
+    GEMINI_TPM_LIMIT = 100_000
+
+    # The classifier only needs the opening of a post to judge intent;
+    # truncating caps input-token spend and latency on long submissions
+    GEMINI_MAX_INPUT_CHARS = 2000
+
+    # Remembered Gemini verdicts, keyed by normalized content hash
+    VERDICT_CACHE_SIZE = 4096
+
+    # Backpressure bounds: candidates buffered for analysis, and Discord
+    # sends allowed in flight at once
+    ANALYSIS_QUEUE_SIZE = 256
+    NOTIFY_CONCURRENCY = 4
+
+    # Posts shorter than this can't carry enough context to qualify
+    MIN_CONTENT_LENGTH = 80
+
     def __init__(self):
         """Initialize the Math Lead Sniper with API credentials."""
         load_dotenv()
@@ -85,7 +145,7 @@ class MathLeadSniper:
 
         # Initialize Reddit client
         try:
-            self.reddit = praw.Reddit(
+            self.reddit = asyncpraw.Reddit(
                 client_id=self.reddit_client_id,
                 client_secret=self.reddit_client_secret,
                 user_agent=self.reddit_user_agent
@@ -107,8 +167,57 @@ class MathLeadSniper:
             logger.error(f"Failed to initialize Gemini AI: {e}")
             raise
 
-        # Cooldown tracking: stores hash of content -> timestamp
-        self.processed_items: Dict[str, float] = {}
+        # Built once: the SDK validates and constructs a protobuf for every
+        # GenerationConfig, so don't pay that per call. The output budget
+        # covers a full batch of 'i: Y/N' lines
+        self._gen_config = genai.types.GenerationConfig(
+            temperature=0.0,  # Deterministic verdicts
+            max_output_tokens=4 * self.MAX_BATCH,
+        )
+
+        # Multi-pattern keyword matcher: built once, finds any trigger keyword
+        # in a single linear pass over the text
+        if ahocorasick is not None:
+            self._trigger_automaton = ahocorasick.Automaton()
+            for keyword in self._LOWERED_TRIGGERS:
+                self._trigger_automaton.add_word(keyword, keyword)
+            self._trigger_automaton.make_automaton()
+            self._trigger_re = None
+        else:
+            # Without the automaton, one compiled alternation still beats a
+            # scan per keyword; re2's DFA avoids backtracking if installed
+            self._trigger_automaton = None
+            pattern = '|'.join(map(re.escape, self._LOWERED_TRIGGERS))
+            engine = re2 if re2 is not None else re
+            self._trigger_re = engine.compile(pattern)
+
+        # Combined subreddit name, joined once; the subreddit object itself is
+        # fetched lazily (asyncpraw needs a running loop) and then reused so
+        # retry loops don't rebuild it
+        self._multireddit_name = '+'.join(self.SUBREDDITS)
+        self._multireddit = None
+
+        # Cooldown tracking: hash of content -> timestamp, in insertion order
+        # so the oldest entries sit at the front for cheap eviction
+        self.processed_items: 'OrderedDict[bytes, float]' = OrderedDict()
+
+        # Shared HTTP session for Discord and RSS requests (created in _main_async)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Candidates awaiting Gemini analysis, drained by _gemini_batch_worker.
+        # Bounded so a stalled analyzer sheds load instead of growing unbounded
+        self._analysis_queue: asyncio.Queue = asyncio.Queue(maxsize=self.ANALYSIS_QUEUE_SIZE)
+
+        # Caps concurrent Discord webhook sends
+        self._notify_semaphore = asyncio.Semaphore(self.NOTIFY_CONCURRENCY)
+
+        # Token buckets so bursts queue locally instead of 429ing at Gemini
+        self._gemini_rpm_limiter = AsyncLimiter(self.GEMINI_RPM_LIMIT, 60)
+        self._gemini_tpm_limiter = AsyncLimiter(self.GEMINI_TPM_LIMIT, 60)
+
+        # LRU of past Gemini verdicts so quoted/cross-posted content is an
+        # O(1) dict hit instead of another API call
+        self._verdict_cache: 'OrderedDict[bytes, bool]' = OrderedDict()
 
     def _validate_config(self):
         """Validate that all required environment variables are set."""
@@ -127,11 +236,30 @@ class MathLeadSniper:
             logger.error(f"Missing required environment variables: {', '.join(missing)}")
             raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
 
-    def _get_content_hash(self, content: str) -> str:
-        """Generate a hash for content to track processed items."""
-        return hashlib.md5(content.encode()).hexdigest()
+    def _get_content_hash(self, content: str) -> bytes:
+        """Generate a hash for content to track processed items.
 
-    def _is_in_cooldown(self, content_hash: str) -> bool:
+        Raw 16-byte digests (not hex strings) keep dict keys half the size;
+        128 bits is plenty for dedup within the cooldown window, and BLAKE3
+        (SIMD) and SHA-256 (SHA-NI on modern CPUs) both beat MD5 here.
+        """
+        if blake3 is not None:
+            return blake3(content.encode()).digest(length=16)
+        return hashlib.sha256(content.encode()).digest()[:16]
+
+    def _get_verdict_key(self, text: str) -> bytes:
+        """Hash key for the verdict cache, tolerant of near-duplicate posts."""
+        normalized = ' '.join(text.lower().split())[:512]
+        return self._get_content_hash(normalized)
+
+    def _store_verdict(self, verdict_key: bytes, verdict: bool):
+        """Remember a Gemini verdict, evicting the least recently used."""
+        self._verdict_cache[verdict_key] = verdict
+        self._verdict_cache.move_to_end(verdict_key)
+        while len(self._verdict_cache) > self.VERDICT_CACHE_SIZE:
+            self._verdict_cache.popitem(last=False)
+
+    def _is_in_cooldown(self, content_hash: bytes) -> bool:
         """Check if content is in cooldown period."""
         if content_hash in self.processed_items:
             time_elapsed = time.time() - self.processed_items[content_hash]
@@ -143,51 +271,156 @@ class MathLeadSniper:
                 del self.processed_items[content_hash]
         return False
 
-    def _mark_processed(self, content_hash: str):
+    def _mark_processed(self, content_hash: bytes):
         """Mark content as processed with current timestamp."""
         self.processed_items[content_hash] = time.time()
+        self.processed_items.move_to_end(content_hash)
 
-        # Clean up old entries (older than 2x cooldown period)
+        # Evict old entries (older than 2x cooldown period) from the front;
+        # insertion order == time order, so this is amortized O(1)
         cutoff_time = time.time() - (self.COOLDOWN_PERIOD * 2)
-        self.processed_items = {
-            k: v for k, v in self.processed_items.items()
-            if v > cutoff_time
-        }
+        while self.processed_items:
+            oldest_hash = next(iter(self.processed_items))
+            if self.processed_items[oldest_hash] > cutoff_time:
+                break
+            self.processed_items.popitem(last=False)
+
+    def _looks_like_lead(self, text: str) -> bool:
+        """Cheap local heuristics to skip obvious non-leads before Gemini.
+
+        A real request for help is rarely a one-liner, and almost always asks
+        a question, says "help", or references specific coursework ("algebra
+        101"). Pure compute, so it's ~free compared to an API round-trip.
+        """
+        if len(text) < self.MIN_CONTENT_LENGTH:
+            return False
+        return (
+            '?' in text
+            or 'help' in text.lower()
+            or any(char.isdigit() for char in text)
+        )
 
     def _contains_trigger_keywords(self, text: str) -> bool:
         """Check if text contains any trigger keywords."""
         text_lower = text.lower()
-        return any(keyword.lower() in text_lower for keyword in self.TRIGGER_KEYWORDS)
+        if self._trigger_automaton is not None:
+            return next(self._trigger_automaton.iter(text_lower), None) is not None
+        return self._trigger_re.search(text_lower) is not None
 
-    def _analyze_with_gemini(self, content: str) -> bool:
+    async def _analyze_with_gemini(self, contents: List[str]) -> List[Optional[bool]]:
         """
-        Analyze content with Gemini AI to determine if it's a qualified lead.
+        Analyze a batch of candidates with Gemini AI in a single API call.
+
+        Args:
+            contents: Texts to classify, one per candidate
 
         Returns:
-            True if Gemini returns 'YES', False otherwise
+            One entry per candidate: True/False for an explicit Y/N verdict,
+            or None when the model gave no answer (API error, unparsed index)
         """
         try:
-            logger.info("Analyzing content with Gemini AI...")
+            logger.info(f"Analyzing batch of {len(contents)} candidate(s) with Gemini AI...")
 
-            response = self.gemini_model.generate_content(
-                content,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.1,  # Low temperature for consistent responses
-                    max_output_tokens=10,  # We only need YES or NO
-                )
+            prompt = "\n\n".join(
+                f"Item {i}:\n{content}" for i, content in enumerate(contents)
             )
 
+            # Rough input-token estimate (~4 chars/token) plus the output budget
+            estimated_tokens = len(prompt) // 4 + 4 * len(contents)
+
+            async with self._gemini_rpm_limiter:
+                await self._gemini_tpm_limiter.acquire(
+                    min(estimated_tokens, self.GEMINI_TPM_LIMIT)
+                )
+                response = await self.gemini_model.generate_content_async(
+                    prompt,
+                    generation_config=self._gen_config
+                )
+
+            # Reconcile the estimate against what the API actually billed
+            usage = getattr(response, 'usage_metadata', None)
+            if usage is not None and usage.total_token_count > estimated_tokens:
+                await self._gemini_tpm_limiter.acquire(
+                    min(usage.total_token_count - estimated_tokens, self.GEMINI_TPM_LIMIT)
+                )
+
             result = response.text.strip().upper()
             logger.info(f"Gemini response: {result}")
 
-            return 'YES' in result
+            verdicts: List[Optional[bool]] = [None] * len(contents)
+            # Leading Y/N also tolerates a model that spells out YES/NO
+            for match in re.finditer(r'^(\d+):\s*(Y|N)', result, re.MULTILINE):
+                index = int(match.group(1))
+                if index < len(verdicts):
+                    verdicts[index] = match.group(2) == 'Y'
+            return verdicts
 
         except Exception as e:
             logger.error(f"Error analyzing with Gemini: {e}")
-            # On error, err on the side of caution and don't filter out
-            return False
+            if '429' in str(e):
+                # Quota exceeded despite local limiting; back off before the
+                # next batch rather than hammering the API
+                logger.warning("Gemini rate limit hit, backing off for 30s")
+                await asyncio.sleep(30)
+            # No verdict produced; the caller must not treat this as a real NO
+            return [None] * len(contents)
+
+    async def _gemini_batch_worker(self):
+        """
+        Drain the analysis queue in batches and dispatch qualified leads.
 
-    def _send_discord_notification(self, title: str, snippet: str, link: str, source: str):
+        Waits for the first candidate, then collects up to MAX_BATCH items (or
+        until BATCH_WINDOW elapses) so one Gemini call classifies them all.
+        """
+        while True:
+            items = [await self._analysis_queue.get()]
+
+            deadline = time.monotonic() + self.BATCH_WINDOW
+            while len(items) < self.MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(
+                        await asyncio.wait_for(self._analysis_queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            verdicts = await self._analyze_with_gemini(
+                [item['combined_text'] for item in items]
+            )
+
+            dispatches = []
+            for item, qualified in zip(items, verdicts):
+                if qualified is None:
+                    # Analysis failed or the model skipped this index; treat it
+                    # as a one-off skip and leave the verdict cache untouched
+                    logger.warning(f"No Gemini verdict for: {item['title']}")
+                    continue
+                self._store_verdict(item['verdict_key'], qualified)
+                if qualified:
+                    logger.info(f"✅ QUALIFIED LEAD: {item['title']}")
+                    dispatches.append(self._dispatch_lead(item))
+                else:
+                    logger.info(f"❌ Not a qualified lead: {item['title']}")
+
+            # Notifications go out in parallel, bounded by the semaphore
+            if dispatches:
+                await asyncio.gather(*dispatches)
+
+    async def _dispatch_lead(self, item: Dict):
+        """Notify Discord about a qualified lead and start its cooldown."""
+        async with self._notify_semaphore:
+            await self._send_discord_notification(
+                title=item['title'],
+                snippet=item['content'][:500],
+                link=item['link'],
+                source=item['source']
+            )
+        self._mark_processed(item['content_hash'])
+
+    async def _send_discord_notification(self, title: str, snippet: str, link: str, source: str):
         """
         Send a formatted notification to Discord webhook.
 
@@ -235,23 +468,32 @@ class MathLeadSniper:
                 "username": "Math Lead Sniper"
             }
 
-            response = requests.post(
-                self.discord_webhook_url,
-                json=payload,
-                timeout=10
-            )
-
-            if response.status_code == 204:
-                logger.info(f"✅ Discord notification sent for: {title}")
+            # orjson serializes the nested embed dict in C; aiohttp's json=
+            # path would use stdlib json.dumps
+            if orjson is not None:
+                body_kwargs = {
+                    'data': orjson.dumps(payload),
+                    'headers': {'Content-Type': 'application/json'},
+                }
             else:
-                logger.error(f"Failed to send Discord notification: {response.status_code}")
+                body_kwargs = {'json': payload}
 
-        except requests.exceptions.Timeout:
+            async with self._session.post(
+                self.discord_webhook_url,
+                timeout=aiohttp.ClientTimeout(total=10),
+                **body_kwargs
+            ) as response:
+                if response.status == 204:
+                    logger.info(f"✅ Discord notification sent for: {title}")
+                else:
+                    logger.error(f"Failed to send Discord notification: {response.status}")
+
+        except asyncio.TimeoutError:
             logger.error("Discord webhook request timed out")
         except Exception as e:
             logger.error(f"Error sending Discord notification: {e}")
 
-    def _process_content(self, title: str, content: str, link: str, source: str):
+    async def _process_content(self, title: str, content: str, link: str, source: str):
         """
         Process a piece of content through the filtering pipeline.
 
@@ -275,30 +517,60 @@ class MathLeadSniper:
 
         logger.info(f"🔍 Trigger keywords found in: {title}")
 
-        # Analyze with Gemini AI
-        if self._analyze_with_gemini(combined_text):
-            logger.info(f"✅ QUALIFIED LEAD: {title}")
-
-            # Send Discord notification
-            self._send_discord_notification(
-                title=title,
-                snippet=content[:500],
-                link=link,
-                source=source
-            )
+        # Cheap heuristics first: don't spend a Gemini call on content that
+        # can't plausibly be a lead
+        if not self._looks_like_lead(combined_text):
+            logger.debug(f"Skipping (low-signal content): {title}")
+            return
 
-            # Mark as processed
-            self._mark_processed(content_hash)
-        else:
-            logger.info(f"❌ Not a qualified lead: {title}")
+        # Reuse a remembered verdict for quoted/cross-posted content
+        verdict_key = self._get_verdict_key(combined_text)
+        cached_verdict = self._verdict_cache.get(verdict_key)
+        if cached_verdict is not None:
+            self._verdict_cache.move_to_end(verdict_key)
+            if cached_verdict:
+                logger.info(f"✅ QUALIFIED LEAD (cached verdict): {title}")
+                # Same bounded dispatch path as fresh verdicts: off the stream
+                # loop and capped by the notify semaphore
+                asyncio.create_task(self._dispatch_lead({
+                    'title': title,
+                    'content': content,
+                    'link': link,
+                    'source': source,
+                    'content_hash': content_hash,
+                }))
+            else:
+                logger.info(f"❌ Not a qualified lead (cached verdict): {title}")
+            return
 
-    def monitor_reddit_submissions(self):
+        # Queue for batched Gemini analysis; _gemini_batch_worker takes it from
+        # here. Never block the stream loops on a full queue — drop instead
+        try:
+            self._analysis_queue.put_nowait({
+                'title': title,
+                'content': content,
+                'link': link,
+                'source': source,
+                'combined_text': combined_text[:self.GEMINI_MAX_INPUT_CHARS],
+                'content_hash': content_hash,
+                'verdict_key': verdict_key,
+            })
+        except asyncio.QueueFull:
+            logger.warning(f"Analysis queue full, dropping candidate: {title}")
+
+    async def _get_multireddit(self):
+        """Return the combined target subreddit, fetching it only once."""
+        if self._multireddit is None:
+            self._multireddit = await self.reddit.subreddit(self._multireddit_name)
+        return self._multireddit
+
+    async def monitor_reddit_submissions(self):
         """Monitor Reddit submissions from target subreddits."""
         try:
             logger.info(f"Monitoring submissions from: {', '.join(self.SUBREDDITS)}")
-            subreddit = self.reddit.subreddit('+'.join(self.SUBREDDITS))
+            subreddit = await self._get_multireddit()
 
-            for submission in subreddit.stream.submissions(skip_existing=True):
+            async for submission in subreddit.stream.submissions(skip_existing=True):
                 try:
                     title = submission.title
                     content = submission.selftext or ""
@@ -306,42 +578,56 @@ class MathLeadSniper:
                     source = f"r/{submission.subreddit.display_name}"
 
                     logger.debug(f"Processing submission: {title}")
-                    self._process_content(title, content, link, source)
+                    await self._process_content(title, content, link, source)
 
                 except Exception as e:
                     logger.error(f"Error processing submission: {e}")
-                    time.sleep(1)  # Brief pause before continuing
+                    await asyncio.sleep(1)  # Brief pause before continuing
 
         except Exception as e:
             logger.error(f"Error in Reddit submission stream: {e}")
             raise
 
-    def monitor_reddit_comments(self):
+    async def monitor_reddit_comments(self):
         """Monitor Reddit comments from target subreddits."""
         try:
             logger.info(f"Monitoring comments from: {', '.join(self.SUBREDDITS)}")
-            subreddit = self.reddit.subreddit('+'.join(self.SUBREDDITS))
+            subreddit = await self._get_multireddit()
 
-            for comment in subreddit.stream.comments(skip_existing=True):
+            async for comment in subreddit.stream.comments(skip_existing=True):
                 try:
-                    # Use submission title as context
-                    title = f"Comment on: {comment.submission.title}"
+                    # Use submission title as context (lazy in asyncpraw)
+                    submission = comment.submission
+                    await submission.load()
+                    title = f"Comment on: {submission.title}"
                     content = comment.body
                     link = f"https://reddit.com{comment.permalink}"
                     source = f"r/{comment.subreddit.display_name} (comment)"
 
                     logger.debug(f"Processing comment: {title}")
-                    self._process_content(title, content, link, source)
+                    await self._process_content(title, content, link, source)
 
                 except Exception as e:
                     logger.error(f"Error processing comment: {e}")
-                    time.sleep(1)  # Brief pause before continuing
+                    await asyncio.sleep(1)  # Brief pause before continuing
 
         except Exception as e:
             logger.error(f"Error in Reddit comment stream: {e}")
             raise
 
-    def monitor_rss_feeds(self):
+    async def _fetch_rss_feed(self, rss_url: str):
+        """Download and parse a single RSS feed."""
+        logger.debug(f"Fetching RSS feed: {rss_url}")
+        async with self._session.get(
+            rss_url,
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as resp:
+            body = await resp.text()
+
+        # feedparser is blocking/CPU-bound; keep it off the event loop
+        return await asyncio.to_thread(feedparser.parse, body)
+
+    async def monitor_rss_feeds(self):
         """Monitor Google Alerts RSS feeds."""
         if not self.google_alerts_rss_urls or self.google_alerts_rss_urls == ['']:
             logger.info("No RSS feeds configured, skipping RSS monitoring")
@@ -349,45 +635,51 @@ class MathLeadSniper:
 
         logger.info(f"Monitoring {len(self.google_alerts_rss_urls)} RSS feeds")
 
-        # Track seen entries across all feeds
-        seen_entries: Set[str] = set()
+        # Track seen entries across all feeds (bounded LRU so memory stays flat)
+        seen_entries: 'OrderedDict[str, None]' = OrderedDict()
+
+        urls = [url for url in self.google_alerts_rss_urls if url.strip()]
 
         while True:
             try:
-                for rss_url in self.google_alerts_rss_urls:
-                    if not rss_url.strip():
-                        continue
-
-                    try:
-                        logger.debug(f"Fetching RSS feed: {rss_url}")
-                        feed = feedparser.parse(rss_url)
+                # Fetch all feeds in parallel; per-cycle wall time is the
+                # slowest feed rather than the sum of all of them
+                feeds = await asyncio.gather(
+                    *(self._fetch_rss_feed(url) for url in urls),
+                    return_exceptions=True
+                )
 
-                        for entry in feed.entries:
-                            entry_id = entry.get('id', entry.get('link', ''))
+                for rss_url, feed in zip(urls, feeds):
+                    if isinstance(feed, Exception):
+                        logger.error(f"Error fetching RSS feed {rss_url}: {feed}")
+                        continue
 
-                            # Skip if already seen
-                            if entry_id in seen_entries:
-                                continue
+                    for entry in feed.entries:
+                        entry_id = entry.get('id', entry.get('link', ''))
 
-                            seen_entries.add(entry_id)
+                        # Skip if already seen
+                        if entry_id in seen_entries:
+                            seen_entries.move_to_end(entry_id)
+                            continue
 
-                            # Extract entry details
-                            title = entry.get('title', 'No Title')
-                            content = entry.get('summary', entry.get('description', ''))
-                            link = entry.get('link', '')
+                        seen_entries[entry_id] = None
+                        while len(seen_entries) > self.MAX_SEEN_RSS_ENTRIES:
+                            seen_entries.popitem(last=False)
 
-                            logger.debug(f"Processing RSS entry: {title}")
-                            self._process_content(title, content, link, "Google Alert")
+                        # Extract entry details
+                        title = entry.get('title', 'No Title')
+                        content = entry.get('summary', entry.get('description', ''))
+                        link = entry.get('link', '')
 
-                    except Exception as e:
-                        logger.error(f"Error fetching RSS feed {rss_url}: {e}")
+                        logger.debug(f"Processing RSS entry: {title}")
+                        await self._process_content(title, content, link, "Google Alert")
 
                 # Check feeds every 5 minutes
-                time.sleep(300)
+                await asyncio.sleep(300)
 
             except Exception as e:
                 logger.error(f"Error in RSS monitoring: {e}")
-                time.sleep(60)  # Wait a minute before retrying
+                await asyncio.sleep(60)  # Wait a minute before retrying
 
     def run(self):
         """Run the Math Lead Sniper (main entry point)."""
@@ -399,54 +691,66 @@ class MathLeadSniper:
         logger.info(f"Cooldown period: {self.COOLDOWN_PERIOD}s")
         logger.info("=" * 60)
 
-        import threading
-
-        # Create threads for different monitoring tasks
-        threads = []
-
-        # Reddit submissions thread
-        submission_thread = threading.Thread(
-            target=self._run_with_retry,
-            args=(self.monitor_reddit_submissions, "Reddit Submissions"),
-            daemon=True
-        )
-        threads.append(submission_thread)
-
-        # Reddit comments thread
-        comment_thread = threading.Thread(
-            target=self._run_with_retry,
-            args=(self.monitor_reddit_comments, "Reddit Comments"),
-            daemon=True
-        )
-        threads.append(comment_thread)
-
-        # RSS feeds thread (if configured)
-        if self.google_alerts_rss_urls and self.google_alerts_rss_urls != ['']:
-            rss_thread = threading.Thread(
-                target=self._run_with_retry,
-                args=(self.monitor_rss_feeds, "RSS Feeds"),
-                daemon=True
-            )
-            threads.append(rss_thread)
-
-        # Start all threads
-        for thread in threads:
-            thread.start()
-
-        # Keep main thread alive
         try:
-            while True:
-                time.sleep(1)
+            asyncio.run(self._main_async())
         except KeyboardInterrupt:
             logger.info("\n🛑 Shutting down Math Lead Sniper...")
             sys.exit(0)
 
-    def _run_with_retry(self, func, name: str):
+    async def _main_async(self):
+        """Run all monitoring coroutines on a shared event loop."""
+        # Shutdown is signal-driven: a single blocking wait on this event
+        # replaces any polling keep-alive loop, so the process stays fully
+        # idle until SIGINT/SIGTERM arrives
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:
+                # Not available on all platforms; KeyboardInterrupt in run()
+                # remains the fallback
+                pass
+
+        # Keep-alive connections so repeat Discord/RSS requests skip the
+        # TCP + TLS handshake
+        connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=60)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            self._session = session
+
+            tasks = [
+                asyncio.create_task(
+                    self._run_with_retry(self.monitor_reddit_submissions, "Reddit Submissions")
+                ),
+                asyncio.create_task(
+                    self._run_with_retry(self.monitor_reddit_comments, "Reddit Comments")
+                ),
+                asyncio.create_task(
+                    self._run_with_retry(self._gemini_batch_worker, "Gemini Batch Worker")
+                ),
+            ]
+
+            # RSS feeds task (if configured)
+            if self.google_alerts_rss_urls and self.google_alerts_rss_urls != ['']:
+                tasks.append(asyncio.create_task(
+                    self._run_with_retry(self.monitor_rss_feeds, "RSS Feeds")
+                ))
+
+            try:
+                await stop.wait()
+                logger.info("\n🛑 Shutting down Math Lead Sniper...")
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await self.reddit.close()
+
+    async def _run_with_retry(self, coro_func, name: str):
         """
-        Run a function with automatic retry on failure.
+        Run a coroutine function with automatic retry on failure.
 
         Args:
-            func: Function to run
+            coro_func: Coroutine function to run
             name: Name of the task (for logging)
         """
         retry_delay = 10
@@ -454,13 +758,13 @@ class MathLeadSniper:
 
         while True:
             try:
-                func()
-            except KeyboardInterrupt:
+                await coro_func()
+            except asyncio.CancelledError:
                 raise
             except Exception as e:
                 logger.error(f"Error in {name}: {e}")
                 logger.info(f"Retrying {name} in {retry_delay}s...")
-                time.sleep(retry_delay)
+                await asyncio.sleep(retry_delay)
 
                 # Exponential backoff
                 retry_delay = min(retry_delay * 2, max_retry_delay)